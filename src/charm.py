@@ -4,6 +4,9 @@
 
 """gateway-api-integrator charm file."""
 
+import concurrent.futures
+import functools
+import hashlib
 import logging
 import typing
 
@@ -18,6 +21,7 @@ from charms.traefik_k8s.v2.ingress import (
     IngressPerAppDataProvidedEvent,
     IngressPerAppDataRemovedEvent,
     IngressPerAppProvider,
+    IngressProviderAppData,
 )
 from lightkube import Client, KubeConfig
 from lightkube.core.exceptions import ConfigError
@@ -28,8 +32,15 @@ from ops.charm import (
     RelationCreatedEvent,
     RelationJoinedEvent,
 )
+from ops.framework import StoredState
 from ops.main import main
-from ops.model import ActiveStatus, MaintenanceStatus, SecretNotFoundError, WaitingStatus
+from ops.model import (
+    ActiveStatus,
+    BlockedStatus,
+    MaintenanceStatus,
+    SecretNotFoundError,
+    WaitingStatus,
+)
 
 from resource_manager.gateway import GatewayResourceDefinition, GatewayResourceManager
 from resource_manager.http_route import (
@@ -38,19 +49,17 @@ from resource_manager.http_route import (
     HTTPRouteResourceManager,
     HTTPRouteType,
 )
+from resource_manager.resource_manager import CREATED_BY_LABEL
 from resource_manager.secret import SecretResourceDefinition, TLSSecretResourceManager
 from resource_manager.service import ServiceResourceDefinition, ServiceResourceManager
 from state.config import CharmConfig
 from state.gateway import GatewayResourceInformation
-from state.http_route import HTTPRouteResourceInformation
-from state.tls import TLSInformation
+from state.http_route import INGRESS_RELATION, HTTPRouteResourceInformation
+from state.tls import TLS_CERTIFICATES_INTEGRATION, TLSInformation
 from state.validation import validate_config_and_integration
 from tls_relation import TLSRelationService, get_hostname_from_cert
 
 logger = logging.getLogger(__name__)
-CREATED_BY_LABEL = "gateway-api-integrator.charm.juju.is/managed-by"
-INGRESS_RELATION = "gateway"
-TLS_CERT_RELATION = "certificates"
 
 
 def _get_client(field_manager: str, namespace: str) -> Client:
@@ -78,13 +87,60 @@ def _get_client(field_manager: str, namespace: str) -> Client:
     return client
 
 
+def _run_concurrently(*calls: typing.Callable[[], typing.Any]) -> list[typing.Any]:
+    """Run independent kubernetes API calls concurrently.
+
+    Args:
+        calls: The calls to run, each without arguments.
+
+    Returns:
+        The results of the calls, in the order of the calls.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = [executor.submit(call) for call in calls]
+        # result() re-raises in this thread any exception raised by the call
+        return [future.result() for future in futures]
+
+
+def _fingerprint(*components: typing.Any) -> str:
+    """Compute a stable digest of the state components used to define resources.
+
+    Args:
+        components: The state components.
+
+    Returns:
+        The hex digest of the components.
+    """
+    return hashlib.blake2b(repr(components).encode(), digest_size=16).hexdigest()
+
+
+def _is_published(databag: typing.Mapping[str, str], url: str) -> bool:
+    """Check if an ingress URL is already published in the provider's app databag.
+
+    Args:
+        databag: The provider's app databag.
+        url: The ingress URL.
+
+    Returns:
+        True if the databag already holds the URL.
+    """
+    published = IngressProviderAppData(ingress={"url": url}).dump()  # type: ignore[arg-type]
+    return all(databag.get(key) == value for key, value in published.items())
+
+
 class LightKubeInitializationError(Exception):
     """Exception raised when initialization of the lightkube client failed."""
 
 
+class IngressTeardownError(Exception):
+    """Exception raised when the ingress resources could not be removed."""
+
+
 class GatewayAPICharm(CharmBase):
     """The main charm class for the gateway-api-integrator charm."""
 
+    _stored = StoredState()
+
     def __init__(self, *args) -> None:  # type: ignore[no-untyped-def]
         """Init method for the class.
 
@@ -93,50 +149,73 @@ class GatewayAPICharm(CharmBase):
         """
         super().__init__(*args)
 
-        self.certificates = TLSCertificatesRequiresV3(self, TLS_CERT_RELATION)
+        self.certificates = TLSCertificatesRequiresV3(self, TLS_CERTIFICATES_INTEGRATION)
         self._ingress_provider = IngressPerAppProvider(charm=self, relation_name=INGRESS_RELATION)
         self._tls = TLSRelationService(self.model, self.certificates)
-
-        self.framework.observe(self.on.config_changed, self._on_config_changed)
-        self.framework.observe(self.on.start, self._on_start)
-
-        self.framework.observe(
-            self.on.certificates_relation_created, self._on_certificates_relation_created
-        )
-        self.framework.observe(
-            self.on.certificates_relation_joined, self._on_certificates_relation_joined
+        # Fingerprints of the inputs used by the last successful resource definitions,
+        # and the hostname the gateway listeners were last defined with
+        self._stored.set_default(
+            gateway_fingerprint="", ingress_fingerprint="", gateway_hostname=""
         )
-        self.framework.observe(
-            self.on.certificates_relation_broken, self._on_certificates_relation_broken
-        )
-        self.framework.observe(
-            self.certificates.on.certificate_available, self._on_certificate_available
-        )
-        self.framework.observe(
-            self.certificates.on.certificate_expiring, self._on_certificate_expiring
-        )
-        self.framework.observe(
-            self.certificates.on.certificate_invalidated, self._on_certificate_invalidated
-        )
-        self.framework.observe(self.on.get_certificate_action, self._on_get_certificate_action)
-        self.framework.observe(
-            self.certificates.on.all_certificates_invalidated,
-            self._on_all_certificates_invalidated,
+
+        observe = self.framework.observe
+        on = self.on
+        certificates_on = self.certificates.on
+        ingress_on = self._ingress_provider.on
+
+        observe(on.config_changed, self._on_config_changed)
+        observe(on.start, self._on_start)
+        observe(on.upgrade_charm, self._on_upgrade_charm)
+
+        observe(on.certificates_relation_created, self._on_certificates_relation_created)
+        observe(on.certificates_relation_joined, self._on_certificates_relation_joined)
+        observe(on.certificates_relation_broken, self._on_certificates_relation_broken)
+        observe(certificates_on.certificate_available, self._on_certificate_available)
+        observe(certificates_on.certificate_expiring, self._on_certificate_expiring)
+        observe(certificates_on.certificate_invalidated, self._on_certificate_invalidated)
+        observe(on.get_certificate_action, self._on_get_certificate_action)
+        observe(
+            certificates_on.all_certificates_invalidated, self._on_all_certificates_invalidated
         )
 
-        self.framework.observe(self._ingress_provider.on.data_provided, self._on_data_provided)
-        self.framework.observe(self._ingress_provider.on.data_removed, self._on_data_removed)
+        observe(ingress_on.data_provided, self._on_data_provided)
+        observe(ingress_on.data_removed, self._on_data_removed)
 
-    @property
+    @functools.cached_property
     def _labels(self) -> dict[str, str]:
         """Get labels assigned to resources created by this app."""
         return {CREATED_BY_LABEL: self.app.name}
 
+    @functools.cached_property
+    def _client(self) -> Client:
+        """Get the lightkube client shared by the handlers of this hook."""
+        return _get_client(field_manager=self.app.name, namespace=self.model.name)
+
+    @functools.cached_property
+    def _config(self) -> CharmConfig:
+        """Get the validated charm config."""
+        return CharmConfig.from_charm(self, self._client)
+
+    @functools.cached_property
+    def _tls_information(self) -> TLSInformation:
+        """Get the TLS information of the certificates relation."""
+        return TLSInformation.from_charm(self, self._tls)
+
+    def _invalidate_cached_state(self, *names: str) -> None:
+        """Drop cached state components so that they are read again on next access.
+
+        Args:
+            names: Names of the cached properties to drop.
+        """
+        for name in names:
+            self.__dict__.pop(name, None)
+
     @validate_config_and_integration(defer=False)
     def _on_config_changed(self, _: typing.Any) -> None:
         """Handle the config-changed event."""
-        client = _get_client(field_manager=self.app.name, namespace=self.model.name)
-        config = CharmConfig.from_charm(self, client)
+        self._invalidate_cached_state("_config")
+        client = self._client
+        config = self._config
 
         if self._certificates_revocation_needed(client, config):
             self._tls.revoke_all_certificates()
@@ -149,8 +228,21 @@ class GatewayAPICharm(CharmBase):
     @validate_config_and_integration(defer=False)
     def _on_start(self, _: typing.Any) -> None:
         """Handle the start event."""
+        # Resources may have been changed out of band while the pod was down
+        self._forget_applied_inputs()
         self._reconcile()
 
+    def _on_upgrade_charm(self, _: typing.Any) -> None:
+        """Handle the upgrade-charm event."""
+        # A new charm revision may define resources differently from the same inputs
+        self._forget_applied_inputs()
+
+    def _forget_applied_inputs(self) -> None:
+        """Forget the inputs of the last resource definitions so that they are applied again."""
+        self._stored.gateway_fingerprint = ""
+        self._stored.ingress_fingerprint = ""
+        self._stored.gateway_hostname = ""
+
     @validate_config_and_integration(defer=False)
     def _on_get_certificate_action(self, event: ActionEvent) -> None:
         """Triggered when users run the `get-certificate` Juju action.
@@ -178,26 +270,27 @@ class GatewayAPICharm(CharmBase):
     def _on_certificates_relation_created(self, _: RelationCreatedEvent) -> None:
         """Handle the TLS Certificate relation created event."""
         TLSInformation.validate(self)
-        client = _get_client(field_manager=self.app.name, namespace=self.model.name)
-        config = CharmConfig.from_charm(self, client)
-        self._tls.generate_private_key(config.external_hostname)
+        self._tls.generate_private_key(self._config.external_hostname)
+        self._invalidate_cached_state("_tls_information")
 
     @validate_config_and_integration(defer=True)
     def _on_certificates_relation_joined(self, _: RelationJoinedEvent) -> None:
         """Handle the TLS Certificate relation joined event."""
         TLSInformation.validate(self)
-        client = _get_client(field_manager=self.app.name, namespace=self.model.name)
-        config = CharmConfig.from_charm(self, client)
-        self._tls.request_certificate(config.external_hostname)
+        self._tls.request_certificate(self._config.external_hostname)
 
     @validate_config_and_integration(defer=False)
     def _on_certificates_relation_broken(self, _: RelationBrokenEvent) -> None:
         """Handle the TLS Certificate relation broken event."""
+        self._invalidate_cached_state("_tls_information")
+        # Without the relation no resources can be defined, skip the k8s round-trips.
+        TLSInformation.validate(self)
         self._reconcile()
 
     @validate_config_and_integration(defer=False)
     def _on_certificate_available(self, _: CertificateAvailableEvent) -> None:
         """Handle the TLS Certificate available event."""
+        self._invalidate_cached_state("_tls_information")
         logger.info("TLS certificate available, creating resources.")
         self._reconcile()
 
@@ -208,6 +301,7 @@ class GatewayAPICharm(CharmBase):
         Args:
             event: The event that fires this method.
         """
+        self._invalidate_cached_state("_tls_information")
         TLSInformation.validate(self)
         self._tls.certificate_expiring(event)
 
@@ -218,6 +312,7 @@ class GatewayAPICharm(CharmBase):
         Args:
             event: The event that fires this method.
         """
+        self._invalidate_cached_state("_tls_information")
         TLSInformation.validate(self)
         if event.reason == "revoked":
             self._tls.certificate_invalidated(event)
@@ -228,14 +323,12 @@ class GatewayAPICharm(CharmBase):
     @validate_config_and_integration(defer=True)
     def _on_all_certificates_invalidated(self, _: AllCertificatesInvalidatedEvent) -> None:
         """Handle the TLS Certificate relation broken event."""
+        self._invalidate_cached_state("_tls_information")
         TLSInformation.validate(self)
-        client = _get_client(field_manager=self.app.name, namespace=self.model.name)
-        config = CharmConfig.from_charm(self, client)
-        hostname = config.external_hostname
+        hostname = self._config.external_hostname
 
         try:
-            secret = self.model.get_secret(label=f"private-key-{hostname}")
-            secret.remove_all_revisions()
+            self._tls.remove_private_key(hostname)
         except SecretNotFoundError:
             logger.warning("Juju secret for %s already does not exist", hostname)
 
@@ -247,33 +340,81 @@ class GatewayAPICharm(CharmBase):
     @validate_config_and_integration(defer=False)
     def _on_data_removed(self, _: IngressPerAppDataRemovedEvent) -> None:
         """Handle the data-removed event."""
-        self._reconcile()
+        # Only the ingress resources depend on the requirer, the gateway and secret stay
+        self._teardown_ingress_resources()
+        self.unit.status = BlockedStatus("Ingress integration not ready.")
+
+    def _teardown_ingress_resources(self) -> None:
+        """Remove the service and http_route resources of the ingress relation.
+
+        Raises:
+            IngressTeardownError: When the cleanup was skipped, so that the hook is retried.
+        """
+        client = self._client
+        cleaned_up = _run_concurrently(
+            functools.partial(
+                ServiceResourceManager(self._labels, client).cleanup_resources, exclude=[]
+            ),
+            functools.partial(
+                HTTPRouteResourceManager(self._labels, client).cleanup_resources, exclude=[]
+            ),
+        )
+        self._stored.ingress_fingerprint = ""
+        # Nothing re-runs the cleanup once the relation is gone, fail the hook instead
+        if not all(cleaned_up):
+            raise IngressTeardownError("Failed to remove the ingress resources.")
 
     def _reconcile(self) -> None:
         """Reconcile charm status based on configuration and integrations.
 
         Actions performed in this method:
             1. Initialize charm state components.
-            2. Create the gateway and secret resources.
-            3. Create ingress-related resources:
+            2. Create the gateway and secret resources concurrently.
+            3. Create ingress-related resources concurrently:
                 - service
                 - http_route (HTTPS)
                 - http_route (HTTPtoHTTPS redirect)
             4. Publish the ingress URL to the requirer charm.
             5. Set the gateway LB address in the charm's status message.
+
+        Steps 2 and 3 are skipped when their inputs match the last successful run. The
+        trade-off is that a resource deleted or edited out of band is only re-applied once
+        the inputs change, or on the next start or upgrade-charm event.
         """
-        client = _get_client(field_manager=self.app.name, namespace=self.model.name)
-        config = CharmConfig.from_charm(self, client)
+        # Fail fast on a missing TLS integration, before any k8s round-trip
+        TLSInformation.validate(self)
+        client = self._client
+        config = self._config
         gateway_resource_information = GatewayResourceInformation.from_charm(self)
-        tls_information = TLSInformation.from_charm(self, self.certificates)
+        tls_information = self._tls_information
 
-        self.unit.status = MaintenanceStatus("Creating resources.")
-        self._define_gateway_resource(
-            client, gateway_resource_information, config, tls_information
+        # Only the certificates, not the private keys, go into the fingerprint
+        gateway_fingerprint = _fingerprint(
+            config, gateway_resource_information, tls_information.tls_certs
         )
-        self._define_secret_resources(client, config, tls_information)
+        gateway_changed = gateway_fingerprint != self._stored.gateway_fingerprint
+        if gateway_changed:
+            self.unit.status = MaintenanceStatus("Creating resources.")
+            # After a partial apply, the revocation check must read the gateway listeners
+            self._stored.gateway_hostname = ""
+            cleaned_up = _run_concurrently(
+                functools.partial(
+                    self._define_gateway_resource,
+                    client,
+                    gateway_resource_information,
+                    config,
+                    tls_information,
+                ),
+                functools.partial(self._define_secret_resources, client, config, tls_information),
+            )
+            self._stored.gateway_hostname = config.external_hostname
+            # A skipped cleanup must run again on the next reconcile
+            if all(cleaned_up):
+                self._stored.gateway_fingerprint = gateway_fingerprint
+        else:
+            logger.info("Gateway and secret inputs unchanged, skipping their definition.")
         self._define_ingress_resources_and_publish_url(
-            client, config, gateway_resource_information
+            client, config, gateway_resource_information, gateway_changed
         )
         self._set_status_gateway_address(client, gateway_resource_information)
 
@@ -283,7 +424,7 @@ class GatewayAPICharm(CharmBase):
         gateway_resource_information: GatewayResourceInformation,
         config: CharmConfig,
         tls_information: TLSInformation,
-    ) -> None:
+    ) -> bool:
         """Define the charm's gateway resource.
 
         Args:
@@ -291,6 +432,9 @@ class GatewayAPICharm(CharmBase):
             gateway_resource_information: Information needed to create the gateway resource.
             config: Charm config.
             tls_information: Information needed to create TLS secret resources.
+
+        Returns:
+            False if the cleanup of stale gateways was skipped, True otherwise.
         """
         resource_definition = GatewayResourceDefinition(
             gateway_resource_information, config, tls_information
@@ -300,20 +444,23 @@ class GatewayAPICharm(CharmBase):
             client=client,
         )
         gateway = resource_manager.define_resource(resource_definition)
-        resource_manager.cleanup_resources(exclude=[gateway])
+        return resource_manager.cleanup_resources(exclude=[gateway])
 
     def _define_secret_resources(
         self,
         client: Client,
         config: CharmConfig,
         tls_information: TLSInformation,
-    ) -> None:
+    ) -> bool:
         """Define TLS secret resources.
 
         Args:
             client: Lightkube client.
             config: Charm config.
             tls_information: TLS-related information needed to create secret resources.
+
+        Returns:
+            False if the cleanup of stale secrets was skipped, True otherwise.
         """
         resource_definition = SecretResourceDefinition.from_tls_information(
             tls_information, config.external_hostname
@@ -323,13 +470,14 @@ class GatewayAPICharm(CharmBase):
             client=client,
         )
         secret = resource_manager.define_resource(resource_definition)
-        resource_manager.cleanup_resources(exclude=[secret])
+        return resource_manager.cleanup_resources(exclude=[secret])
 
     def _define_ingress_resources_and_publish_url(
         self,
         client: Client,
         config: CharmConfig,
         gateway_resource_information: GatewayResourceInformation,
+        creating_status_set: bool,
     ) -> None:
         """Define ingress-relation resources and publish the ingress URL.
 
@@ -337,41 +485,85 @@ class GatewayAPICharm(CharmBase):
             client: Lightkube client.
             config: Charm config.
             gateway_resource_information: Information needed to attach http_route resources.
+            creating_status_set: Whether the unit already reports that resources are created.
         """
         http_route_resource_information = HTTPRouteResourceInformation.from_charm(
             self, self._ingress_provider
         )
-        service_resource_manager = ServiceResourceManager(self._labels, client)
-        service = service_resource_manager.define_resource(
-            ServiceResourceDefinition(http_route_resource_information)
+        ingress_fingerprint = _fingerprint(
+            http_route_resource_information, gateway_resource_information
         )
+        if ingress_fingerprint != self._stored.ingress_fingerprint:
+            if not creating_status_set:
+                self.unit.status = MaintenanceStatus("Creating resources.")
+            # A skipped cleanup must run again on the next reconcile
+            if self._define_ingress_resources(
+                client, http_route_resource_information, gateway_resource_information
+            ):
+                self._stored.ingress_fingerprint = ingress_fingerprint
+        else:
+            logger.info("Ingress inputs unchanged, skipping the ingress resources definition.")
+        url = (
+            f"https://{config.external_hostname}"
+            f"/{http_route_resource_information.requirer_model_name}"
+            f"-{http_route_resource_information.application_name}"
+        )
+        relation = self.model.get_relation(INGRESS_RELATION)
+        # Writing an unchanged URL would still cost a relation-set call
+        if relation and _is_published(relation.data[self.app], url):
+            logger.info("Ingress URL already published, skipping.")
+            return
+        self._ingress_provider.publish_url(relation, url)
+
+    def _define_ingress_resources(
+        self,
+        client: Client,
+        http_route_resource_information: HTTPRouteResourceInformation,
+        gateway_resource_information: GatewayResourceInformation,
+    ) -> bool:
+        """Define the service and http_route resources of the ingress relation.
+
+        Args:
+            client: Lightkube client.
+            http_route_resource_information: Information needed to create ingress resources.
+            gateway_resource_information: Information needed to attach http_route resources.
+
+        Returns:
+            False if the cleanup of stale resources was skipped, True otherwise.
+        """
+        service_resource_manager = ServiceResourceManager(self._labels, client)
         http_route_resource_manager = HTTPRouteResourceManager(self._labels, client)
         redirect_resource_manager = HTTPRouteRedirectResourceManager(self._labels, client)
-        redirect_route = redirect_resource_manager.define_resource(
-            HTTPRouteResourceDefinition(
-                http_route_resource_information,
-                gateway_resource_information,
-                HTTPRouteType.HTTP,
-            )
-        )
-        https_route = http_route_resource_manager.define_resource(
-            HTTPRouteResourceDefinition(
-                http_route_resource_information,
-                gateway_resource_information,
-                HTTPRouteType.HTTPS,
-            )
+        service, redirect_route, https_route = _run_concurrently(
+            functools.partial(
+                service_resource_manager.define_resource,
+                ServiceResourceDefinition(http_route_resource_information),
+            ),
+            functools.partial(
+                redirect_resource_manager.define_resource,
+                HTTPRouteResourceDefinition(
+                    http_route_resource_information,
+                    gateway_resource_information,
+                    HTTPRouteType.HTTP,
+                ),
+            ),
+            functools.partial(
+                http_route_resource_manager.define_resource,
+                HTTPRouteResourceDefinition(
+                    http_route_resource_information,
+                    gateway_resource_information,
+                    HTTPRouteType.HTTPS,
+                ),
+            ),
         )
-        service_resource_manager.cleanup_resources(exclude=[service])
-        http_route_resource_manager.cleanup_resources(exclude=[https_route, redirect_route])
-        relation = self.model.get_relation(INGRESS_RELATION)
-        self._ingress_provider.publish_url(
-            relation,
-            (
-                f"https://{config.external_hostname}"
-                f"/{http_route_resource_information.requirer_model_name}"
-                f"-{http_route_resource_information.application_name}"
+        cleaned_up = _run_concurrently(
+            functools.partial(service_resource_manager.cleanup_resources, exclude=[service]),
+            functools.partial(
+                http_route_resource_manager.cleanup_resources,
+                exclude=[https_route, redirect_route],
             ),
         )
+        return all(cleaned_up)
 
     def _set_status_gateway_address(
         self, client: Client, gateway_resource_information: GatewayResourceInformation
@@ -386,6 +578,7 @@ class GatewayAPICharm(CharmBase):
             labels=self._labels,
             client=client,
         )
+        # Polling the address can take up to a minute, tell the operator what is awaited
         self.unit.status = WaitingStatus("Waiting for gateway address")
         if gateway_address := resource_manager.gateway_address(
             gateway_resource_information.gateway_name
@@ -404,6 +597,10 @@ class GatewayAPICharm(CharmBase):
         Returns:
             True if the current certificate needs to be revoked.
         """
+        # The gateway listeners were last defined with this hostname, skip the k8s round-trip
+        if self._stored.gateway_hostname == config.external_hostname:
+            return False
+
         gateway_resource_manager = GatewayResourceManager(
             labels=self._labels,
             client=client,
@@ -413,11 +610,10 @@ class GatewayAPICharm(CharmBase):
             return False
 
         gateway_listeners = gateway.spec["listeners"]
-        listener_hostnames = [listener["hostname"] for listener in gateway_listeners]
-        if len(set(listener_hostnames)) == 1 and config.external_hostname == listener_hostnames[0]:
-            return False
-
-        return True
+        # Revoke unless every listener already uses the configured hostname
+        return not gateway_listeners or any(
+            listener["hostname"] != config.external_hostname for listener in gateway_listeners
+        )
 
 
 if __name__ == "__main__":  # pragma: no cover
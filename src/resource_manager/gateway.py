@@ -11,7 +11,6 @@ from lightkube import Client
 from lightkube.core.client import LabelSelector
 from lightkube.generic_resource import GenericNamespacedResource, create_namespaced_resource
 from lightkube.models.meta_v1 import ObjectMeta
-from lightkube.types import PatchType
 
 from state.base import ResourceDefinition
 from state.config import CharmConfig
@@ -19,13 +18,16 @@ from state.gateway import GatewayResourceInformation
 from state.tls import TLSInformation
 
 from .permission import map_k8s_auth_exception
-from .resource_manager import ResourceManager
+from .resource_manager import ResourceManager, name_field_selector
 
 logger = logging.getLogger(__name__)
 
 CUSTOM_RESOURCE_GROUP_NAME = "gateway.networking.k8s.io"
 GATEWAY_RESOURCE_NAME = "Gateway"
 GATEWAY_PLURAL = "gateways"
+GATEWAY_GENERIC_RESOURCE = create_namespaced_resource(
+    CUSTOM_RESOURCE_GROUP_NAME, "v1", GATEWAY_RESOURCE_NAME, GATEWAY_PLURAL
+)
 
 
 @dataclasses.dataclass
@@ -77,18 +79,6 @@ class GatewayResourceManager(ResourceManager[GenericNamespacedResource]):
         """
         self._client = client
         self._labels = labels
-        self._gateway_generic_resource = create_namespaced_resource(
-            CUSTOM_RESOURCE_GROUP_NAME, "v1", GATEWAY_RESOURCE_NAME, GATEWAY_PLURAL
-        )
-
-    @property
-    def _label_selector(self) -> str:
-        """Return the label selector for resources managed by this controller.
-
-        Return:
-            The label selector.
-        """
-        return ",".join(f"{k}={v}" for k, v in self._labels.items())
 
     @map_k8s_auth_exception
     def _gen_resource(self, resource_definition: ResourceDefinition) -> dict:
@@ -103,7 +93,7 @@ class GatewayResourceManager(ResourceManager[GenericNamespacedResource]):
         gateway_resource_definition = typing.cast(GatewayResourceDefinition, resource_definition)
         prefix = gateway_resource_definition.secret_resource_name_prefix
         tls_secret_name = f"{prefix}-{gateway_resource_definition.external_hostname}"
-        gateway = self._gateway_generic_resource(
+        gateway = GATEWAY_GENERIC_RESOURCE(
             apiVersion="gateway.networking.k8s.io/v1",
             kind="Gateway",
             metadata=ObjectMeta(
@@ -133,41 +123,34 @@ class GatewayResourceManager(ResourceManager[GenericNamespacedResource]):
         return gateway
 
     @map_k8s_auth_exception
-    def _create_resource(self, resource: GenericNamespacedResource) -> None:
-        """Create a new gateway resource in the current namespace.
+    def _apply_resource(self, resource: GenericNamespacedResource) -> None:
+        """Create or update a gateway resource in the current namespace with server-side apply.
 
         Args:
-            resource: The gateway resource object to create.
+            resource: The gateway resource object to apply.
         """
-        self._client.create(resource)
-
-    @map_k8s_auth_exception
-    def _patch_resource(self, name: str, resource: GenericNamespacedResource) -> None:
-        """Replace an existing gateway resource in the current namespace.
-
-        Args:
-            name: The name of the resource to patch.
-            resource: The modified gateway resource object.
-        """
-        # Patch the resource with server-side apply
         # force=True is required here so that the charm keeps control of the resource
-        self._client.patch(  # type: ignore[type-var]
-            # mypy can't detect that this is ok for patching custom resources
-            self._gateway_generic_resource,
-            name,
-            resource,
-            patch_type=PatchType.APPLY,
-            force=True,
-        )
+        self._client.apply(resource, force=True)
 
     @map_k8s_auth_exception
-    def _list_resource(self) -> typing.List[GenericNamespacedResource]:
+    def _list_resource(
+        self, exclude: typing.Collection[str] = ()
+    ) -> typing.List[GenericNamespacedResource]:
         """List gateway resources in the current namespace based on a label selector.
 
+        Args:
+            exclude: Names of the resources to leave out of the listing.
+
         Returns:
             A list of matched gateway resources.
         """
-        return list(self._client.list(res=self._gateway_generic_resource, labels=self._labels))
+        return list(
+            self._client.list(
+                res=GATEWAY_GENERIC_RESOURCE,
+                labels=self._labels,
+                fields=name_field_selector(exclude),
+            )
+        )
 
     @map_k8s_auth_exception
     def _delete_resource(self, name: str) -> None:
@@ -177,7 +160,7 @@ class GatewayResourceManager(ResourceManager[GenericNamespacedResource]):
             name: The name of the V1Ingress resource to delete.
         """
         self._client.delete(
-            res=self._gateway_generic_resource,
+            res=GATEWAY_GENERIC_RESOURCE,
             name=name,
         )
 
@@ -198,7 +181,7 @@ class GatewayResourceManager(ResourceManager[GenericNamespacedResource]):
         while time.time() < deadline:
             try:
                 gateway = self._client.get(
-                    self._gateway_generic_resource,
+                    GATEWAY_GENERIC_RESOURCE,
                     name=name,
                 )
                 gateway_addresses = [
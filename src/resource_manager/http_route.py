@@ -12,20 +12,22 @@ from lightkube import Client
 from lightkube.core.client import LabelSelector
 from lightkube.generic_resource import GenericNamespacedResource, create_namespaced_resource
 from lightkube.models.meta_v1 import ObjectMeta
-from lightkube.types import PatchType
 
 from state.base import ResourceDefinition
 from state.gateway import GatewayResourceInformation
 from state.http_route import HTTPRouteResourceInformation
 
 from .permission import map_k8s_auth_exception
-from .resource_manager import ResourceManager
+from .resource_manager import ResourceManager, name_field_selector
 
 logger = logging.getLogger(__name__)
 
 CUSTOM_RESOURCE_GROUP_NAME = "gateway.networking.k8s.io"
 HTTP_ROUTE_RESOURCE_NAME = "HTTPRoute"
 HTTP_ROUTE_PLURAL = "httproutes"
+HTTP_ROUTE_GENERIC_RESOURCE = create_namespaced_resource(
+    CUSTOM_RESOURCE_GROUP_NAME, "v1", HTTP_ROUTE_RESOURCE_NAME, HTTP_ROUTE_PLURAL
+)
 
 
 class HTTPRouteType(StrEnum):
@@ -93,9 +95,6 @@ class HTTPRouteResourceManager(ResourceManager[GenericNamespacedResource]):
         """
         self._client = client
         self._labels = labels
-        self._http_route_generic_resource_class = create_namespaced_resource(
-            CUSTOM_RESOURCE_GROUP_NAME, "v1", HTTP_ROUTE_RESOURCE_NAME, HTTP_ROUTE_PLURAL
-        )
 
     @map_k8s_auth_exception
     def _gen_resource(self, resource_definition: ResourceDefinition) -> GenericNamespacedResource:
@@ -149,7 +148,7 @@ class HTTPRouteResourceManager(ResourceManager[GenericNamespacedResource]):
             ],
         }
 
-        http_route = self._http_route_generic_resource_class(
+        http_route = HTTP_ROUTE_GENERIC_RESOURCE(
             apiVersion=f"{CUSTOM_RESOURCE_GROUP_NAME}/v1",
             kind=HTTP_ROUTE_RESOURCE_NAME,
             metadata=ObjectMeta(
@@ -165,42 +164,33 @@ class HTTPRouteResourceManager(ResourceManager[GenericNamespacedResource]):
         return http_route
 
     @map_k8s_auth_exception
-    def _create_resource(self, resource: GenericNamespacedResource) -> None:
-        """Create a new secret resource in a given namespace.
-
-        Args:
-            resource: The secret resource object to create.
-        """
-        self._client.create(resource)
-
-    @map_k8s_auth_exception
-    def _patch_resource(self, name: str, resource: GenericNamespacedResource) -> None:
-        """Replace an existing gateway resource in the current namespace.
+    def _apply_resource(self, resource: GenericNamespacedResource) -> None:
+        """Create or update a HTTPRoute resource in the current namespace with server-side apply.
 
         Args:
-            name: The name of the resource to patch.
-            resource: The modified gateway resource object.
+            resource: The HTTPRoute resource object to apply.
         """
-        # Patch the resource with server-side apply
         # force=True is required here so that the charm keeps control of the resource
-        self._client.patch(  # type: ignore[type-var]
-            # mypy can't detect that this is ok for patching custom resources
-            self._http_route_generic_resource_class,
-            name,
-            resource,
-            patch_type=PatchType.APPLY,
-            force=True,
-        )
+        self._client.apply(resource, force=True)
 
     @map_k8s_auth_exception
-    def _list_resource(self) -> typing.List[GenericNamespacedResource]:
+    def _list_resource(
+        self, exclude: typing.Collection[str] = ()
+    ) -> typing.List[GenericNamespacedResource]:
         """List secret resources in a given namespace based on a label selector.
 
+        Args:
+            exclude: Names of the resources to leave out of the listing.
+
         Returns:
             A list of matched secret resources.
         """
         return list(
-            self._client.list(res=self._http_route_generic_resource_class, labels=self._labels)
+            self._client.list(
+                res=HTTP_ROUTE_GENERIC_RESOURCE,
+                labels=self._labels,
+                fields=name_field_selector(exclude),
+            )
         )
 
     @map_k8s_auth_exception
@@ -210,7 +200,7 @@ class HTTPRouteResourceManager(ResourceManager[GenericNamespacedResource]):
         Args:
             name: The name of the secret resource to delete.
         """
-        self._client.delete(res=self._http_route_generic_resource_class, name=name)
+        self._client.delete(res=HTTP_ROUTE_GENERIC_RESOURCE, name=name)
 
 
 class HTTPRouteRedirectResourceManager(HTTPRouteResourceManager):
@@ -256,7 +246,7 @@ class HTTPRouteRedirectResourceManager(HTTPRouteResourceManager):
                 }
             ],
         }
-        http_route = self._http_route_generic_resource_class(
+        http_route = HTTP_ROUTE_GENERIC_RESOURCE(
             apiVersion=f"{CUSTOM_RESOURCE_GROUP_NAME}/v1",
             kind=HTTP_ROUTE_RESOURCE_NAME,
             metadata=ObjectMeta(
@@ -6,6 +6,9 @@ import abc
 import logging
 import typing
 
+from lightkube import operators
+from lightkube.core.client import FieldSelector
+from lightkube.core.exceptions import ApiError
 from lightkube.generic_resource import GenericNamespacedResource
 from lightkube.resources.core_v1 import Secret, Service
 
@@ -41,6 +44,20 @@ def resource_name(resource: AnyResource | None) -> typing.Optional[str]:
     return resource.metadata.name
 
 
+def name_field_selector(exclude: typing.Collection[str]) -> FieldSelector:
+    """Build a field selector that leaves the given resource names out of a listing.
+
+    Args:
+        exclude: Names of the resources to leave out.
+
+    Returns:
+        The field selector, empty if there is nothing to exclude.
+    """
+    if not exclude:
+        return {}
+    return {"metadata.name": operators.not_in(exclude)}
+
+
 class ResourceManager(typing.Protocol[AnyResource]):
     """Abstract base class for a generic Kubernetes resource controller."""
 
@@ -53,26 +70,21 @@ class ResourceManager(typing.Protocol[AnyResource]):
         """
 
     @abc.abstractmethod
-    def _create_resource(self, resource: AnyResource) -> None:
-        """Abstract method to create a new resource in the current namespace.
+    def _apply_resource(self, resource: AnyResource) -> None:
+        """Abstract method to create or update a resource in the current namespace.
 
         Args:
-            resource: The resource object to create.
+            resource: The resource object to apply.
         """
 
     @abc.abstractmethod
-    def _patch_resource(self, name: str, resource: AnyResource) -> None:
-        """Abstract method to patch an existing resource in the current namespace.
+    def _list_resource(self, exclude: typing.Collection[str] = ()) -> typing.List[AnyResource]:
+        """Abstract method to list resources in the current namespace based on a label selector.
 
         Args:
-            name: The name of the resource to patch.
-            resource: The modified resource object.
+            exclude: Names of the resources to leave out of the listing.
         """
 
-    @abc.abstractmethod
-    def _list_resource(self) -> typing.List[AnyResource]:
-        """Abstract method to list resources in the current namespace based on a label selector."""
-
     @abc.abstractmethod
     def _delete_resource(self, name: str) -> None:
         """Abstract method to delete a resource from the current namespace.
@@ -93,31 +105,42 @@ class ResourceManager(typing.Protocol[AnyResource]):
         Raises:
             InvalidResourceError: If the generated resource is invalid.
         """
-        resource_list = self._list_resource()
         resource = self._gen_resource(state)
-        res_name = resource_name(resource)
-        if not res_name:
+        if not resource_name(resource):
             raise InvalidResourceError("Missing resource name.")
 
-        resources = [resource_name(r) for r in resource_list if resource_name(r) is not None]
-        if res_name in resources:
-            self._patch_resource(name=res_name, resource=resource)
-        else:
-            self._create_resource(resource=resource)
+        # Server-side apply creates or updates the resource in a single request
+        self._apply_resource(resource=resource)
         return resource
 
     def cleanup_resources(
         self,
         exclude: list[AnyResource],
-    ) -> None:
+    ) -> bool:
         """Remove unused resources.
 
         Args:
             exclude: The name of resource to be excluded from the cleanup.
+
+        Returns:
+            False if the cleanup was skipped and needs to be retried, True otherwise.
         """
-        excluded_resource_names = [resource_name(resource) for resource in exclude]
-        for resource in self._list_resource():
+        excluded_resource_names = [
+            name for resource in exclude if (name := resource_name(resource))
+        ]
+        try:
+            # The kept resources are filtered out by the API server, only stale ones are returned
+            stale_resources = self._list_resource(exclude=excluded_resource_names)
+        except ApiError as exc:
+            # Only throttling and server errors are transient
+            if exc.status.code is None or (exc.status.code < 500 and exc.status.code != 429):
+                raise
+            # Don't fail the hook on a busy API server, the caller must retry the cleanup later
+            logger.warning("Skipping cleanup of stale resources: %s", exc.status.message)
+            return False
+        for resource in stale_resources:
             res_name = resource_name(resource)
             if not res_name or res_name in excluded_resource_names:
                 continue
             self._delete_resource(name=res_name)
+        return True
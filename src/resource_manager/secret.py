@@ -11,14 +11,13 @@ from lightkube import Client
 from lightkube.core.client import LabelSelector
 from lightkube.models.meta_v1 import ObjectMeta
 from lightkube.resources.core_v1 import Secret
-from lightkube.types import PatchType
 
 from state.base import ResourceDefinition
 from state.exception import CharmStateValidationBaseError
 from state.tls import TLSInformation
 
 from .permission import map_k8s_auth_exception
-from .resource_manager import ResourceManager
+from .resource_manager import ResourceManager, name_field_selector
 
 logger = logging.getLogger(__name__)
 
@@ -139,41 +138,28 @@ class TLSSecretResourceManager(ResourceManager[Secret]):
         return secret
 
     @map_k8s_auth_exception
-    def _create_resource(self, resource: Secret) -> None:
-        """Create a new secret resource in a given namespace.
+    def _apply_resource(self, resource: Secret) -> None:
+        """Create or update a secret resource in the current namespace with server-side apply.
 
         Args:
-            resource: The secret resource object to create.
+            resource: The secret resource object to apply.
         """
-        self._client.create(resource)
-
-    @map_k8s_auth_exception
-    def _patch_resource(self, name: str, resource: Secret) -> None:
-        """Replace an existing gateway resource in the current namespace.
-
-        Args:
-            name: The name of the resource to patch.
-            resource: The modified gateway resource object.
-        """
-        # Patch the resource with server-side apply
         # force=True is required here so that the charm keeps control of the resource
-        self._client.patch(  # type: ignore[type-var]
-            # mypy can't detect that this is ok for patching custom resources
-            Secret,
-            name,
-            resource,
-            patch_type=PatchType.APPLY,
-            force=True,
-        )
+        self._client.apply(resource, force=True)
 
     @map_k8s_auth_exception
-    def _list_resource(self) -> typing.List[Secret]:
+    def _list_resource(self, exclude: typing.Collection[str] = ()) -> typing.List[Secret]:
         """List secret resources in a given namespace based on a label selector.
 
+        Args:
+            exclude: Names of the resources to leave out of the listing.
+
         Returns:
             A list of matched secret resources.
         """
-        return list(self._client.list(res=Secret, labels=self._labels))
+        return list(
+            self._client.list(res=Secret, labels=self._labels, fields=name_field_selector(exclude))
+        )
 
     @map_k8s_auth_exception
     def _delete_resource(self, name: str) -> None:
@@ -20,6 +20,9 @@ from .exception import CharmStateValidationBaseError
 CUSTOM_RESOURCE_GROUP_NAME = "gateway.networking.k8s.io"
 GATEWAY_CLASS_RESOURCE_NAME = "GatewayClass"
 GATEWAY_CLASS_PLURAL = "gatewayclasses"
+GATEWAY_CLASS_GENERIC_RESOURCE = create_global_resource(
+    CUSTOM_RESOURCE_GROUP_NAME, "v1", GATEWAY_CLASS_RESOURCE_NAME, GATEWAY_CLASS_PLURAL
+)
 
 logger = logging.getLogger()
 
@@ -43,7 +46,7 @@ class CharmConfig:
 
     gateway_class_name: str = Field(min_length=1)
     external_hostname: str = Field(
-        min_length=1, pattern=r"[a-z0-9]([-a-z0-9]*[a-z0-9])?(\\.[a-z0-9]([-a-z0-9]*[a-z0-9])?)*"
+        min_length=1, pattern=r"^[a-z0-9]([-a-z0-9]*[a-z0-9])?(\.[a-z0-9]([-a-z0-9]*[a-z0-9])?)*$"
     )
 
     @classmethod
@@ -63,10 +66,7 @@ class CharmConfig:
             CharmConfig: Instance of the charm config state component.
         """
         gateway_class_name = typing.cast(str, charm.config.get("gateway-class"))
-        gateway_class_generic_resource = create_global_resource(
-            CUSTOM_RESOURCE_GROUP_NAME, "v1", GATEWAY_CLASS_RESOURCE_NAME, GATEWAY_CLASS_PLURAL
-        )
-        gateway_classes = tuple(client.list(gateway_class_generic_resource))
+        gateway_classes = tuple(client.list(GATEWAY_CLASS_GENERIC_RESOURCE))
         if not gateway_classes:
             logger.error("No gateway class available on cluster.")
             raise GatewayClassUnavailableError("No gateway class available on cluster.")
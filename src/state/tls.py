@@ -6,9 +6,8 @@
 import dataclasses
 
 import ops
-from charms.tls_certificates_interface.v3.tls_certificates import TLSCertificatesRequiresV3
 
-from tls_relation import get_hostname_from_cert
+from tls_relation import TLSRelationService, get_hostname_from_cert
 
 from .exception import CharmStateValidationBaseError
 
@@ -34,14 +33,12 @@ class TLSInformation:
     tls_keys: dict[str, dict[str, str]]
 
     @classmethod
-    def from_charm(
-        cls, charm: ops.CharmBase, certificates: TLSCertificatesRequiresV3
-    ) -> "TLSInformation":
+    def from_charm(cls, charm: ops.CharmBase, tls: TLSRelationService) -> "TLSInformation":
         """Get TLS information from a charm instance.
 
         Args:
             charm: The gateway-api-integrator charm.
-            certificates: TLS certificates requirer library.
+            tls: TLS relation service holding the certificates and private keys.
 
         Returns:
             TLSInformation: Information about configured TLS certs.
@@ -52,14 +49,11 @@ class TLSInformation:
         tls_keys = {}
         secret_resource_name_prefix = f"{charm.app.name}-secret"
 
-        for cert in certificates.get_provider_certificates():
+        for cert in tls.certificates.get_provider_certificates():
             hostname = get_hostname_from_cert(cert.certificate)
             tls_certs[hostname] = cert.certificate
-            secret = charm.model.get_secret(label=f"private-key-{hostname}")
-            tls_keys[hostname] = {
-                "key": secret.get_content()["key"],
-                "password": secret.get_content()["password"],
-            }
+            private_key, password = tls.get_private_key(hostname)
+            tls_keys[hostname] = {"key": private_key, "password": password}
 
         return cls(
             secret_resource_name_prefix=secret_resource_name_prefix,
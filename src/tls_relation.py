@@ -3,6 +3,7 @@
 # Since the relations invoked in the methods are taken from the charm,
 # mypy guesses the relations might be None about all of them.
 """Gateway API TLS relation business logic."""
+import functools
 import logging
 import secrets
 import string
@@ -18,9 +19,8 @@ from charms.tls_certificates_interface.v3.tls_certificates import (
 )
 from cryptography import x509
 from cryptography.x509.oid import NameOID
-from ops.model import Model, Relation, SecretNotFoundError
+from ops.model import Model, Relation, Secret, SecretNotFoundError
 
-TLS_CERT = "certificates"
 logger = logging.getLogger()
 
 
@@ -40,6 +40,20 @@ class KeyPair(typing.NamedTuple):
     password: str
 
 
+def private_key_secret_label(hostname: str) -> str:
+    """Get the label of the juju secret holding the private key of a hostname.
+
+    Args:
+        hostname: The certificate's hostname.
+
+    Returns:
+        The juju secret label.
+    """
+    return f"private-key-{hostname}"
+
+
+# Provider certificates are parsed by several handlers and state components in one hook
+@functools.lru_cache(maxsize=256)
 def get_hostname_from_cert(certificate: str) -> str:
     """Get the hostname from a certificate subject name.
 
@@ -77,6 +91,8 @@ class TLSRelationService:
         self.model = model
         self.application = self.model.app
         self.integration_name = self.certificates.relationship_name
+        # Private key secrets fetched during this hook, keyed by hostname
+        self._secrets: dict[str, Secret] = {}
 
     def generate_password(self) -> str:
         """Generate a random 12 character password.
@@ -93,7 +109,7 @@ class TLSRelationService:
         Args:
             hostname: Certificate's hostname.
         """
-        private_key, password = self._get_private_key(hostname)
+        private_key, password = self.get_private_key(hostname)
         csr = generate_csr(
             private_key=private_key.encode(),
             private_key_password=password.encode(),
@@ -125,11 +141,12 @@ class TLSRelationService:
             "key": private_key.decode(),
         }
         try:
-            secret = self.model.get_secret(label=f"private-key-{hostname}")
-            secret.set_content(private_key_dict)
+            self._get_secret(hostname).set_content(private_key_dict)
+            # A Secret object keeps serving its old content after set_content
+            del self._secrets[hostname]
         except SecretNotFoundError:
             secret = self.application.add_secret(
-                content=private_key_dict, label=f"private-key-{hostname}"
+                content=private_key_dict, label=private_key_secret_label(hostname)
             )
             secret.grant(tls_integration)
 
@@ -145,7 +162,7 @@ class TLSRelationService:
         if expiring_cert := self._get_cert(event.certificate):
             hostname = get_hostname_from_cert(expiring_cert.certificate)
             old_csr = expiring_cert.csr
-            private_key, password = self._get_private_key(hostname)
+            private_key, password = self.get_private_key(hostname)
             new_csr = generate_csr(
                 private_key=private_key.encode(),
                 private_key_password=password.encode(),
@@ -168,8 +185,7 @@ class TLSRelationService:
         """
         if invalidated_cert := self._get_cert(event.certificate):
             hostname = get_hostname_from_cert(invalidated_cert.certificate)
-            secret = self.model.get_secret(label=f"private-key-{hostname}")
-            secret.remove_all_revisions()
+            self.remove_private_key(hostname)
             self.certificates.request_certificate_revocation(
                 certificate_signing_request=invalidated_cert.csr.encode()
             )
@@ -179,15 +195,14 @@ class TLSRelationService:
         for certificate in self.certificates.get_provider_certificates():
             hostname = get_hostname_from_cert(certificate.certificate)
             try:
-                secret = self.model.get_secret(label=f"private-key-{hostname}")
-                secret.remove_all_revisions()
+                self.remove_private_key(hostname)
             except SecretNotFoundError:
                 logger.warning("Secret not found, skipping.")
             self.certificates.request_certificate_revocation(
                 certificate_signing_request=certificate.csr.encode()
             )
 
-    def _get_private_key(self, hostname: str) -> KeyPair:
+    def get_private_key(self, hostname: str) -> KeyPair:
         """Return the private key and its password from either juju secrets or the relation data.
 
         Args:
@@ -196,10 +211,32 @@ class TLSRelationService:
         Returns:
             The encrypted private key.
         """
-        secret = self.model.get_secret(label=f"private-key-{hostname}")
-        private_key = secret.get_content()["key"]
-        password = secret.get_content()["password"]
-        return KeyPair(private_key, password)
+        content = self._get_secret(hostname).get_content()
+        return KeyPair(content["key"], content["password"])
+
+    def remove_private_key(self, hostname: str) -> None:
+        """Remove all revisions of the juju secret holding the private key of a hostname.
+
+        Args:
+            hostname: The hostname of the private key to remove.
+        """
+        self._get_secret(hostname).remove_all_revisions()
+        del self._secrets[hostname]
+
+    def _get_secret(self, hostname: str) -> Secret:
+        """Get the juju secret holding the private key of a hostname.
+
+        Args:
+            hostname: The hostname of the private key.
+
+        Returns:
+            The juju secret, fetched at most once per hook.
+        """
+        if hostname not in self._secrets:
+            self._secrets[hostname] = self.model.get_secret(
+                label=private_key_secret_label(hostname)
+            )
+        return self._secrets[hostname]
 
     def _get_cert(self, certificate: str) -> typing.Optional[ProviderCertificate]:
         """Get a cert from the provider's integration data that matches 'certificate'.
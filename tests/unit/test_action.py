@@ -3,6 +3,8 @@
 
 """Unit tests for charm file."""
 
+from unittest.mock import MagicMock
+
 import ops
 import ops.testing
 import pytest
@@ -44,3 +46,33 @@ def test_on_get_certificates_action_invalid_hostname(
     harness.begin()
     with pytest.raises(ops.testing.ActionFailed):
         harness.run_action("get-certificate", params={"hostname": "invalid-hostname"})
+
+
+def test_on_get_certificates_action_returns_first_match(
+    harness: Harness, certificates_relation_data: dict[str, str], monkeypatch: pytest.MonkeyPatch
+):
+    """
+    arrange: given a charm with two provider certificates for the same hostname,
+    as during a renewal.
+    act: Run the get-certificate action.
+    assert: the first certificate is returned.
+    """
+    first_cert = MagicMock(certificate="first", ca="ca", chain_as_pem=MagicMock(return_value=""))
+    second_cert = MagicMock(certificate="second", ca="ca", chain_as_pem=MagicMock(return_value=""))
+    monkeypatch.setattr(
+        "charm.TLSCertificatesRequiresV3.get_provider_certificates",
+        MagicMock(return_value=[first_cert, second_cert]),
+    )
+    monkeypatch.setattr(
+        "charm.get_hostname_from_cert", MagicMock(return_value=TEST_EXTERNAL_HOSTNAME_CONFIG)
+    )
+    harness.add_relation(
+        "certificates", "self-signed-certificates", app_data=certificates_relation_data
+    )
+    harness.begin()
+
+    output = harness.run_action(
+        "get-certificate", params={"hostname": TEST_EXTERNAL_HOSTNAME_CONFIG}
+    )
+
+    assert output.results["certificate"] == "first"
@@ -66,8 +66,9 @@ def test_tls_information_integration_missing(harness: Harness):
     assert: TLSIntegrationMissingError is raised.
     """
     harness.begin()
+    # pylint: disable=protected-access
     with pytest.raises(TlsIntegrationMissingError):
-        TLSInformation.from_charm(harness.charm, harness.charm.certificates)
+        TLSInformation.from_charm(harness.charm, harness.charm._tls)
 
 
 @pytest.mark.usefixtures("client_with_mock_external")
@@ -272,3 +273,62 @@ def test_request_certificates(harness: Harness, monkeypatch: pytest.MonkeyPatch)
     tls = tls_relation.TLSRelationService(harness.model, harness.charm.certificates)
     tls.request_certificate(TEST_EXTERNAL_HOSTNAME_CONFIG)
     request_certificate_creation_mock.assert_called_once()
+
+
+def test_certificates_relation_broken(
+    harness: Harness,
+    client_with_mock_external: MagicMock,
+    certificates_relation_data: dict[str, str],
+    config: dict[str, str],
+):
+    """
+    arrange: Given a charm with valid config and certificates integration.
+    act: Remove the certificates integration.
+    assert: The charm is blocked without querying the kubernetes API.
+    """
+    harness.update_config(config)
+    relation_id = harness.add_relation(
+        "certificates", "self-signed-certificates", app_data=certificates_relation_data
+    )
+    harness.begin()
+    client_with_mock_external.list.reset_mock()
+
+    harness.remove_relation(relation_id)
+
+    assert harness.charm.unit.status.name == ops.BlockedStatus.name
+    client_with_mock_external.list.assert_not_called()
+
+
+def test_get_hostname_from_cert_cached(mock_certificate: str):
+    """
+    arrange: Given a provider certificate.
+    act: Get the hostname from the certificate twice.
+    assert: The certificate is parsed only once.
+    """
+    tls_relation.get_hostname_from_cert.cache_clear()
+
+    hostname = tls_relation.get_hostname_from_cert(mock_certificate)
+
+    assert hostname == TEST_EXTERNAL_HOSTNAME_CONFIG
+    assert tls_relation.get_hostname_from_cert(mock_certificate) == hostname
+    assert tls_relation.get_hostname_from_cert.cache_info().hits == 1
+
+
+def test_private_key_secret_fetched_once(harness: Harness, monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: Given a TLSRelationService and a mocked juju secret.
+    act: Read the private key twice, then remove it.
+    assert: The juju secret is fetched only once.
+    """
+    secret_mock = MagicMock(spec=Secret)
+    secret_mock.get_content.return_value = {"key": "key", "password": "password"}
+    get_secret_mock = MagicMock(return_value=secret_mock)
+    monkeypatch.setattr("ops.model.Model.get_secret", get_secret_mock)
+    tls = tls_relation.TLSRelationService(harness.model, MagicMock())
+
+    tls.get_private_key(TEST_EXTERNAL_HOSTNAME_CONFIG)
+    tls.get_private_key(TEST_EXTERNAL_HOSTNAME_CONFIG)
+    tls.remove_private_key(TEST_EXTERNAL_HOSTNAME_CONFIG)
+
+    get_secret_mock.assert_called_once()
+    secret_mock.remove_all_revisions.assert_called_once()
@@ -3,18 +3,21 @@
 
 """Unit tests for charm file."""
 
+import typing
 from unittest.mock import MagicMock
 
 import ops
 import pytest
 from httpx import Response
 from lightkube.core.exceptions import ApiError, ConfigError
-from lightkube.generic_resource import GenericNamespacedResource
+from lightkube.generic_resource import GenericGlobalResource, GenericNamespacedResource
 from lightkube.models.meta_v1 import ObjectMeta, Status
 from ops.testing import Harness
 
+import charm
 from charm import LightKubeInitializationError
 from resource_manager.permission import InsufficientPermissionError
+from resource_manager.secret import CertificateDataNotReadyError
 
 from .conftest import GATEWAY_CLASS_CONFIG, TEST_EXTERNAL_HOSTNAME_CONFIG
 
@@ -106,7 +109,7 @@ def test_reconcile_api_error_4xx(
         MagicMock(return_value=None),
     )
 
-    client_with_mock_external.create.side_effect = ApiError(response=MagicMock(spec=Response))
+    client_with_mock_external.apply.side_effect = ApiError(response=MagicMock(spec=Response))
     relation_id = harness.add_relation("certificates", "self-signed-certificates")
     harness.update_relation_data(relation_id, harness.model.app.name, certificates_relation_data)
     harness.begin()
@@ -136,7 +139,7 @@ def test_reconcile_api_error_forbidden(
         "resource_manager.gateway.GatewayResourceManager.current_gateway_resource",
         MagicMock(return_value=None),
     )
-    client_with_mock_external.create.side_effect = ApiError(response=MagicMock(spec=Response))
+    client_with_mock_external.apply.side_effect = ApiError(response=MagicMock(spec=Response))
     relation_id = harness.add_relation("certificates", "self-signed-certificates")
     harness.update_relation_data(relation_id, harness.model.app.name, certificates_relation_data)
     harness.begin()
@@ -210,3 +213,335 @@ def test_certificate_revocation_needed_no_listeners(
         mock_lightkube_client, MagicMock()
     )
     assert certificate_revocation_needed is True
+
+
+@pytest.mark.parametrize(
+    "listener_hostnames, expected",
+    [
+        pytest.param([TEST_EXTERNAL_HOSTNAME_CONFIG] * 2, False, id="matching."),
+        pytest.param([TEST_EXTERNAL_HOSTNAME_CONFIG, "old.internal"], True, id="mismatching."),
+    ],
+)
+def test_certificate_revocation_needed_listener_hostnames(
+    harness: Harness,
+    mock_lightkube_client: MagicMock,
+    listener_hostnames: list[str],
+    expected: bool,
+):
+    """
+    arrange: Given a charm with mocked lightkube client.
+    act: Calls the _certificates_revocation_needed method with a
+    current gateway resource having the given listener hostnames.
+    assert: Revocation is only needed if a listener hostname differs from the config.
+    """
+    mock_lightkube_client.list = MagicMock(
+        return_value=[
+            GenericNamespacedResource(
+                metadata=ObjectMeta(name="gateway"),
+                spec={"listeners": [{"hostname": hostname} for hostname in listener_hostnames]},
+            )
+        ]
+    )
+    harness.begin()
+
+    # pylint: disable=protected-access
+    certificate_revocation_needed = harness.charm._certificates_revocation_needed(
+        mock_lightkube_client, MagicMock(external_hostname=TEST_EXTERNAL_HOSTNAME_CONFIG)
+    )
+
+    assert certificate_revocation_needed is expected
+
+
+def test_certificate_revocation_not_needed_for_defined_hostname(
+    harness: Harness,
+    mock_lightkube_client: MagicMock,
+):
+    """
+    arrange: Given a charm that last defined its gateway with the configured hostname.
+    act: Calls the _certificates_revocation_needed method.
+    assert: False is returned without querying kubernetes.
+    """
+    harness.begin()
+    # pylint: disable=protected-access
+    harness.charm._stored.gateway_hostname = TEST_EXTERNAL_HOSTNAME_CONFIG
+
+    certificate_revocation_needed = harness.charm._certificates_revocation_needed(
+        mock_lightkube_client, MagicMock(external_hostname=TEST_EXTERNAL_HOSTNAME_CONFIG)
+    )
+
+    assert certificate_revocation_needed is False
+    mock_lightkube_client.list.assert_not_called()
+
+
+@pytest.mark.usefixtures("client_with_mock_external")
+def test_lightkube_client_reused_within_hook(
+    harness: Harness,
+    certificates_relation_data: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+    config: dict[str, str],
+):
+    """
+    arrange: Given a charm with valid tls integration and a mocked client factory.
+    act: Update the charm with valid config, running both config-changed and reconcile.
+    assert: The lightkube client is only initialized once.
+    """
+    monkeypatch.setattr(
+        "resource_manager.gateway.GatewayResourceManager.current_gateway_resource",
+        MagicMock(return_value=None),
+    )
+    relation_id = harness.add_relation("certificates", "self-signed-certificates")
+    harness.update_relation_data(relation_id, harness.model.app.name, certificates_relation_data)
+    harness.begin()
+    get_client_mock = MagicMock(wraps=charm._get_client)
+    monkeypatch.setattr("charm._get_client", get_client_mock)
+
+    harness.update_config(config)
+
+    get_client_mock.assert_called_once()
+
+
+def test_run_concurrently_propagates_errors():
+    """
+    arrange: Given one call that succeeds and one call that raises an ApiError.
+    act: Run both calls concurrently.
+    assert: The ApiError is re-raised to the caller.
+    """
+    succeeding_call = MagicMock(return_value="resource")
+    failing_call = MagicMock(side_effect=ApiError(response=MagicMock(spec=Response)))
+
+    with pytest.raises(ApiError):
+        charm._run_concurrently(succeeding_call, failing_call)  # pylint: disable=protected-access
+
+    succeeding_call.assert_called_once()
+
+
+def test_reconcile_skipped_when_inputs_unchanged(
+    harness: Harness,
+    client_with_mock_external: MagicMock,
+    certificates_relation_data: dict[str, str],
+    gateway_relation_application_data: dict[str, str],
+    gateway_relation_unit_data: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+    config: dict[str, str],
+):  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    """
+    arrange: Given a charm with valid tls/gateway integration that has already reconciled.
+    act: Reconcile again with the same config and integrations, then after a start
+    and an upgrade.
+    assert: Resources are only defined again, and only reported as being created, after
+    the start and the upgrade.
+    """
+    monkeypatch.setattr(
+        "resource_manager.gateway.GatewayResourceManager.current_gateway_resource",
+        MagicMock(return_value=None),
+    )
+    relation_id = harness.add_relation("certificates", "self-signed-certificates")
+    harness.update_relation_data(relation_id, harness.model.app.name, certificates_relation_data)
+    harness.add_relation(
+        "gateway",
+        "ingress-requirer",
+        app_data=gateway_relation_application_data,
+        unit_data=gateway_relation_unit_data,
+    )
+    harness.set_leader()
+    harness.begin()
+    harness.update_config(config)
+    apply_count = client_with_mock_external.apply.call_count
+    maintenance_status_mock = MagicMock(wraps=ops.MaintenanceStatus)
+    monkeypatch.setattr("charm.MaintenanceStatus", maintenance_status_mock)
+
+    harness.charm._reconcile()  # pylint: disable=protected-access
+
+    assert client_with_mock_external.apply.call_count == apply_count
+    maintenance_status_mock.assert_not_called()
+    assert harness.charm.unit.status.name == ops.ActiveStatus.name
+
+    harness.charm.on.start.emit()
+
+    assert client_with_mock_external.apply.call_count > apply_count
+    apply_count = client_with_mock_external.apply.call_count
+
+    harness.charm.on.upgrade_charm.emit()
+    harness.charm._reconcile()  # pylint: disable=protected-access
+
+    assert client_with_mock_external.apply.call_count > apply_count
+
+
+def test_reconcile_retries_skipped_cleanup(
+    harness: Harness,
+    client_with_mock_external: MagicMock,
+    certificates_relation_data: dict[str, str],
+    gateway_relation_application_data: dict[str, str],
+    gateway_relation_unit_data: dict[str, str],
+    gateway_class_resource: GenericGlobalResource,
+    monkeypatch: pytest.MonkeyPatch,
+    config: dict[str, str],
+):  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    """
+    arrange: Given a charm with valid tls/gateway integration and mocked client
+    returning 503 on the cleanup listings.
+    act: Reconcile, then reconcile again once the API server recovers.
+    assert: The skipped cleanup runs again on the second reconcile.
+    """
+    monkeypatch.setattr(
+        "resource_manager.gateway.GatewayResourceManager.current_gateway_resource",
+        MagicMock(return_value=None),
+    )
+    monkeypatch.setattr(
+        "lightkube.models.meta_v1.Status.from_dict",
+        MagicMock(return_value=Status(code=503)),
+    )
+
+    def list_failing_cleanup(*_: typing.Any, **kwargs: typing.Any) -> list:
+        """Fail the cleanup listings, which are the only ones with a field selector."""
+        if "fields" in kwargs:
+            raise ApiError(response=MagicMock(spec=Response))
+        return [gateway_class_resource]
+
+    client_with_mock_external.list.side_effect = list_failing_cleanup
+    relation_id = harness.add_relation("certificates", "self-signed-certificates")
+    harness.update_relation_data(relation_id, harness.model.app.name, certificates_relation_data)
+    harness.add_relation(
+        "gateway",
+        "ingress-requirer",
+        app_data=gateway_relation_application_data,
+        unit_data=gateway_relation_unit_data,
+    )
+    harness.set_leader()
+    harness.begin()
+    harness.update_config(config)
+    client_with_mock_external.list.side_effect = None
+    client_with_mock_external.list.return_value = []
+    client_with_mock_external.list.reset_mock()
+
+    harness.charm._reconcile()  # pylint: disable=protected-access
+
+    cleanup_listings = [
+        call for call in client_with_mock_external.list.call_args_list if "fields" in call.kwargs
+    ]
+    assert len(cleanup_listings) == 4
+
+
+@pytest.mark.usefixtures("client_with_mock_external")
+def test_reconcile_waits_for_gateway_address(
+    harness: Harness,
+    certificates_relation_data: dict[str, str],
+    gateway_relation_application_data: dict[str, str],
+    gateway_relation_unit_data: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+    config: dict[str, str],
+):  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    """
+    arrange: Given a charm with valid tls/gateway integration.
+    act: Update the charm with valid config.
+    assert: The unit is waiting for the gateway address while it is polled.
+    """
+    monkeypatch.setattr(
+        "resource_manager.gateway.GatewayResourceManager.current_gateway_resource",
+        MagicMock(return_value=None),
+    )
+    statuses_while_polling = []
+
+    def gateway_address(_: str) -> str:
+        """Record the unit status while the gateway address is polled."""
+        statuses_while_polling.append(harness.charm.unit.status)
+        return "10.0.0.0"
+
+    monkeypatch.setattr(
+        "resource_manager.gateway.GatewayResourceManager.gateway_address",
+        MagicMock(side_effect=gateway_address),
+    )
+    relation_id = harness.add_relation("certificates", "self-signed-certificates")
+    harness.update_relation_data(relation_id, harness.model.app.name, certificates_relation_data)
+    harness.add_relation(
+        "gateway",
+        "ingress-requirer",
+        app_data=gateway_relation_application_data,
+        unit_data=gateway_relation_unit_data,
+    )
+    harness.set_leader()
+    harness.begin()
+
+    harness.update_config(config)
+
+    assert statuses_while_polling == [ops.WaitingStatus("Waiting for gateway address")]
+    assert harness.charm.unit.status.name == ops.ActiveStatus.name
+
+
+@pytest.mark.usefixtures("client_with_mock_external")
+def test_reconcile_partial_apply_forgets_gateway_hostname(
+    harness: Harness,
+    certificates_relation_data: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+    config: dict[str, str],
+):
+    """
+    arrange: Given a charm that last defined its gateway with another hostname,
+    and no certificate for the configured one.
+    act: Update the charm with valid config.
+    assert: The stored gateway hostname is cleared so the revocation check reads the gateway.
+    """
+    monkeypatch.setattr(
+        "resource_manager.gateway.GatewayResourceManager.current_gateway_resource",
+        MagicMock(return_value=None),
+    )
+    monkeypatch.setattr(
+        "charm.GatewayAPICharm._define_secret_resources",
+        MagicMock(side_effect=CertificateDataNotReadyError),
+    )
+    relation_id = harness.add_relation("certificates", "self-signed-certificates")
+    harness.update_relation_data(relation_id, harness.model.app.name, certificates_relation_data)
+    harness.begin()
+    # pylint: disable=protected-access
+    harness.charm._stored.gateway_hostname = "old.internal"
+
+    harness.update_config(config)
+
+    assert harness.charm._stored.gateway_hostname == ""
+    assert harness.charm.unit.status.name == ops.BlockedStatus.name
+
+
+@pytest.mark.usefixtures("client_with_mock_external")
+def test_config_validated_once_within_hook(
+    harness: Harness,
+    certificates_relation_data: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+    config: dict[str, str],
+):
+    """
+    arrange: Given a charm with valid tls integration.
+    act: Update the charm with valid config, running both config-changed and reconcile.
+    assert: The charm config is only validated once.
+    """
+    monkeypatch.setattr(
+        "resource_manager.gateway.GatewayResourceManager.current_gateway_resource",
+        MagicMock(return_value=None),
+    )
+    from_charm_mock = MagicMock(wraps=charm.CharmConfig.from_charm)
+    monkeypatch.setattr("charm.CharmConfig.from_charm", from_charm_mock)
+    relation_id = harness.add_relation("certificates", "self-signed-certificates")
+    harness.update_relation_data(relation_id, harness.model.app.name, certificates_relation_data)
+    harness.begin()
+
+    harness.update_config(config)
+
+    from_charm_mock.assert_called_once()
+
+
+def test_reconcile_missing_tls_skips_kubernetes(
+    harness: Harness,
+    mock_lightkube_client: MagicMock,
+    config: dict[str, str],
+):
+    """
+    arrange: Given a charm with valid config and no tls integration.
+    act: Fire the start event.
+    assert: The charm is blocked without querying kubernetes.
+    """
+    harness.update_config(config)
+    harness.begin()
+
+    harness.charm.on.start.emit()
+
+    assert harness.charm.unit.status.name == ops.BlockedStatus.name
+    mock_lightkube_client.list.assert_not_called()
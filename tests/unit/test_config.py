@@ -13,7 +13,7 @@ from ops.testing import Harness
 
 from state.config import CharmConfig, InvalidCharmConfigError
 
-from .conftest import GATEWAY_CLASS_CONFIG
+from .conftest import GATEWAY_CLASS_CONFIG, TEST_EXTERNAL_HOSTNAME_CONFIG
 
 
 @pytest.mark.parametrize(
@@ -41,3 +41,56 @@ def test_config(harness: Harness, available_gateway_classes: str):
     harness.begin()
     with pytest.raises(InvalidCharmConfigError):
         _ = CharmConfig.from_charm(harness.charm, client_mock)
+
+
+@pytest.mark.parametrize(
+    "external_hostname",
+    [
+        pytest.param("gateway_internal", id="underscore."),
+        pytest.param("Gateway.internal", id="uppercase."),
+        pytest.param("gateway..internal", id="empty label."),
+        pytest.param("*.gateway.internal", id="wildcard."),
+    ],
+)
+def test_config_invalid_hostname(harness: Harness, external_hostname: str):
+    """
+    arrange: Given a charm with an available gateway class and an invalid hostname.
+    act: Initialize the CharmConfig state component.
+    assert: InvalidCharmConfigError is raised.
+    """
+    harness.update_config(
+        {
+            "gateway-class": GATEWAY_CLASS_CONFIG,
+            "external-hostname": external_hostname,
+        }
+    )
+    client_mock = MagicMock(spec=Client)
+    client_mock.list = MagicMock(
+        return_value=[GenericGlobalResource(metadata=ObjectMeta(name=GATEWAY_CLASS_CONFIG))]
+    )
+    harness.begin()
+    with pytest.raises(InvalidCharmConfigError):
+        _ = CharmConfig.from_charm(harness.charm, client_mock)
+
+
+def test_config_valid_hostname(harness: Harness):
+    """
+    arrange: Given a charm with an available gateway class and a valid hostname.
+    act: Initialize the CharmConfig state component.
+    assert: The configured hostname is kept.
+    """
+    harness.update_config(
+        {
+            "gateway-class": GATEWAY_CLASS_CONFIG,
+            "external-hostname": TEST_EXTERNAL_HOSTNAME_CONFIG,
+        }
+    )
+    client_mock = MagicMock(spec=Client)
+    client_mock.list = MagicMock(
+        return_value=[GenericGlobalResource(metadata=ObjectMeta(name=GATEWAY_CLASS_CONFIG))]
+    )
+    harness.begin()
+
+    charm_config = CharmConfig.from_charm(harness.charm, client_mock)
+
+    assert charm_config.external_hostname == TEST_EXTERNAL_HOSTNAME_CONFIG
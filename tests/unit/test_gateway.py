@@ -141,7 +141,7 @@ def test_gateway_gen_resource(
         labels=harness.charm._labels,
         client=client_with_mock_external,
     )
-    tls_information = TLSInformation.from_charm(harness.charm, harness.charm.certificates)
+    tls_information = TLSInformation.from_charm(harness.charm, harness.charm._tls)
     config = CharmConfig.from_charm(harness.charm, client_with_mock_external)
     gateway_resource = gateway_resource_manager._gen_resource(
         GatewayResourceDefinition(gateway_resource_information, config, tls_information)
@@ -184,6 +184,64 @@ def test_get_current_gateway(mock_lightkube_client: MagicMock):
     assert gateway.metadata.name == "gateway"
 
 
+def test_cleanup_gateway_excludes_kept_resource_server_side(mock_lightkube_client: MagicMock):
+    """
+    arrange: Given an GatewayResourceManager with mocked lightkube client
+    list method returning one stale gateway resource.
+    act: Call cleanup_resources excluding the current gateway.
+    assert: The kept gateway is excluded by a field selector and the stale one is deleted.
+    """
+    mock_lightkube_client.list = MagicMock(
+        return_value=[GenericNamespacedResource(metadata=ObjectMeta(name="stale"))]
+    )
+    gateway_resource_manager = GatewayResourceManager(
+        labels={},
+        client=mock_lightkube_client,
+    )
+
+    gateway_resource_manager.cleanup_resources(
+        exclude=[GenericNamespacedResource(metadata=ObjectMeta(name="gateway"))]
+    )
+
+    name_selector = mock_lightkube_client.list.call_args.kwargs["fields"]["metadata.name"]
+    assert name_selector.op_name == "not_in"
+    assert name_selector.value == ["gateway"]
+    mock_lightkube_client.delete.assert_called_once()
+    assert mock_lightkube_client.delete.call_args.kwargs["name"] == "stale"
+
+
+@pytest.mark.parametrize(
+    "error_code",
+    [
+        pytest.param(429, id="too many requests."),
+        pytest.param(503, id="service unavailable."),
+    ],
+)
+def test_cleanup_gateway_api_error_transient(
+    mock_lightkube_client: MagicMock, monkeypatch: pytest.MonkeyPatch, error_code: int
+):
+    """
+    arrange: Given an GatewayResourceManager with mocked lightkube client
+    list method returning a transient error.
+    act: Call cleanup_resources.
+    assert: The error is swallowed, the cleanup reported as skipped and nothing is deleted.
+    """
+    monkeypatch.setattr(
+        "lightkube.models.meta_v1.Status.from_dict",
+        MagicMock(return_value=Status(code=error_code)),
+    )
+    mock_lightkube_client.list = MagicMock(side_effect=ApiError(response=MagicMock(spec=Response)))
+    gateway_resource_manager = GatewayResourceManager(
+        labels={},
+        client=mock_lightkube_client,
+    )
+
+    cleaned_up = gateway_resource_manager.cleanup_resources(exclude=[])
+
+    assert cleaned_up is False
+    mock_lightkube_client.delete.assert_not_called()
+
+
 def test_gateway_address(mock_lightkube_client: MagicMock):
     """
     arrange: Given an GatewayResourceManager with mocked lightkube client
@@ -109,15 +109,15 @@ def test_httproute_gen_resource(
     )
 
 
-def test_patch_http_route(mock_lightkube_client: MagicMock):
+def test_apply_http_route(mock_lightkube_client: MagicMock):
     """
     arrange: Given an HTTPRouteResourceManager with mocked lightkube client.
-    act: Call _patch_resource.
+    act: Call _apply_resource.
     assert: The mocked client method is called.
     """
     http_route_resource_manager = HTTPRouteResourceManager(
         labels={},
         client=mock_lightkube_client,
     )
-    http_route_resource_manager._patch_resource("", None)
-    mock_lightkube_client.patch.assert_called_once()
+    http_route_resource_manager._apply_resource(None)
+    mock_lightkube_client.apply.assert_called_once()
@@ -5,11 +5,19 @@
 # pylint: disable=protected-access
 
 """Unit tests for ingress."""
+import json
+import logging
 from unittest.mock import MagicMock
 
+import ops
 import pytest
+from httpx import Response
+from lightkube.core.exceptions import ApiError
+from lightkube.models.meta_v1 import ObjectMeta, Status
 from ops.testing import Harness
 
+from charm import IngressTeardownError
+
 
 def test_ingress_ipa_provided(
     harness: Harness,
@@ -40,15 +48,20 @@ def test_ingress_ipa_provided(
 
 def test_ingress_ipa_removed(
     harness: Harness,
+    mock_lightkube_client: MagicMock,
     monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
 ):
     """
-    arrange: Given a charm with mocked _reconcile method.
+    arrange: Given a charm with mocked _reconcile method and one managed service and route.
     act: Fire the ingress_data_removed event.
-    assert: the charm correctly calls the _reconcile method.
+    assert: the ingress resources are deleted without a full reconcile or an error logged.
     """
     reconcile_mock = MagicMock()
     monkeypatch.setattr("charm.GatewayAPICharm._reconcile", reconcile_mock)
+    mock_lightkube_client.list.side_effect = lambda res, **_: [
+        res(metadata=ObjectMeta(name=f"stale-{res.__name__.lower()}"))
+    ]
     relation_id = harness.add_relation(
         "gateway",
         "test-charm",
@@ -58,4 +71,80 @@ def test_ingress_ipa_removed(
     harness.charm._ingress_provider.on.data_removed.emit(
         harness.model.get_relation("gateway", relation_id)
     )
-    reconcile_mock.assert_called_once()
+
+    reconcile_mock.assert_not_called()
+    deleted = {call.kwargs["name"] for call in mock_lightkube_client.delete.call_args_list}
+    assert deleted == {"stale-service", "stale-httproute"}
+    assert harness.charm.unit.status.name == ops.BlockedStatus.name
+    assert harness.charm.unit.status.message == "Ingress integration not ready."
+    assert not [record for record in caplog.records if record.levelno >= logging.ERROR]
+
+
+def test_ingress_ipa_removed_cleanup_skipped(
+    harness: Harness,
+    mock_lightkube_client: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    arrange: Given a charm with mocked lightkube client returning 503 on listings.
+    act: Fire the ingress_data_removed event.
+    assert: The hook fails so that Juju retries the teardown.
+    """
+    monkeypatch.setattr(
+        "lightkube.models.meta_v1.Status.from_dict", MagicMock(return_value=Status(code=503))
+    )
+    mock_lightkube_client.list.side_effect = ApiError(response=MagicMock(spec=Response))
+    relation_id = harness.add_relation(
+        "gateway",
+        "test-charm",
+    )
+    harness.begin()
+
+    with pytest.raises(IngressTeardownError):
+        harness.charm._ingress_provider.on.data_removed.emit(
+            harness.model.get_relation("gateway", relation_id)
+        )
+
+
+@pytest.mark.usefixtures("client_with_mock_external")
+def test_ingress_url_published_once(
+    harness: Harness,
+    certificates_relation_data: dict[str, str],
+    gateway_relation_application_data: dict[str, str],
+    gateway_relation_unit_data: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+    config: dict[str, str],
+):  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    """
+    arrange: Given a charm with valid tls/gateway integration and the ingress URL published.
+    act: Reconcile again.
+    assert: the ingress URL is not written to the relation again.
+    """
+    monkeypatch.setattr(
+        "resource_manager.gateway.GatewayResourceManager.current_gateway_resource",
+        MagicMock(return_value=None),
+    )
+    publish_url_mock = MagicMock()
+    monkeypatch.setattr(
+        "charms.traefik_k8s.v2.ingress.IngressPerAppProvider.publish_url", publish_url_mock
+    )
+    relation_id = harness.add_relation("certificates", "self-signed-certificates")
+    harness.update_relation_data(relation_id, harness.model.app.name, certificates_relation_data)
+    gateway_relation_id = harness.add_relation(
+        "gateway",
+        "ingress-requirer",
+        app_data=gateway_relation_application_data,
+        unit_data=gateway_relation_unit_data,
+    )
+    harness.set_leader()
+    harness.begin()
+    harness.update_config(config)
+    publish_url_mock.assert_called_once()
+    _, url = publish_url_mock.call_args.args
+    harness.update_relation_data(
+        gateway_relation_id, harness.model.app.name, {"ingress": json.dumps({"url": url})}
+    )
+
+    harness.charm._reconcile()
+
+    publish_url_mock.assert_called_once()
@@ -63,7 +63,7 @@ def test_secret_gen_resource(
         labels=harness.charm._labels,
         client=client_with_mock_external,
     )
-    tls_information = TLSInformation.from_charm(harness.charm, harness.charm.certificates)
+    tls_information = TLSInformation.from_charm(harness.charm, harness.charm._tls)
     secret_resource = secret_resource_manager._gen_resource(
         SecretResourceDefinition.from_tls_information(tls_information, config["external-hostname"])
     )